@@ -15,15 +15,127 @@ Note: This is a demo. For production, separate modules, add OCR (pytesseract/pdf
 
 import re
 import json
+import calendar
+from functools import lru_cache, partial
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, fields as dataclass_fields, is_dataclass
 from datetime import datetime, date
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, Tuple, List, Iterable
+
+try:  # optional: much faster JSON encoding, falls back to the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None
+
+# ------------------------- Patterns -------------------------
+# Compiled once at import so the per-claim hot path only calls .search().
+
+_DATE_PATTERNS = (
+    re.compile(r"\d{1,2}+[/-]\d{1,2}+[/-]\d{2,4}+"),
+    re.compile(r"\d{4}[/-]\d{1,2}+[/-]\d{1,2}+"),
+)
+_MONTH_DATE_RE = re.compile(r"(\d{1,2}+\s++[A-Za-z]{3,9}+\s++\d{4})")
+# Full and abbreviated month names -> month number (e.g. 'december', 'dec')
+_MONTHS = {n.lower(): i for names in (calendar.month_name, calendar.month_abbr)
+           for i, n in enumerate(names) if n}
+# Guard regex -> the single strptime format it implies, in precedence order.
+# Guards mirror strptime's own day/month ranges so a token only reaches the
+# one format that can accept it.
+_DAY = r"(?:0?[1-9]|[12]\d|3[01])"
+_MONTH = r"(?:0?[1-9]|1[0-2])"
+_DATE_FORMATS = (
+    (re.compile(rf"{_DAY}/{_MONTH}/\d{{4}}"), "%d/%m/%Y"),
+    (re.compile(rf"{_DAY}-{_MONTH}-\d{{4}}"), "%d-%m-%Y"),
+    (re.compile(rf"{_DAY}/{_MONTH}/\d{{2}}"), "%d/%m/%y"),
+    (re.compile(rf"\d{{4}}-{_MONTH}-{_DAY}"), "%Y-%m-%d"),
+    (re.compile(rf"{_MONTH}/{_DAY}/\d{{4}}"), "%m/%d/%Y"),
+    (re.compile(rf"{_MONTH}-{_DAY}-\d{{4}}"), "%m-%d-%Y"),
+)
+
+# All line-anchored labelled fields are captured in a single scan; each
+# alternative stores its value in a named group, so m.lastgroup says which
+# field matched. finditer never overlaps matches, so anything that can sit
+# mid-line next to another field (phone, reported date) is searched separately.
+# (A multi-pattern DFA such as Hyperscan would only report match offsets:
+# it has no capture groups, so every value would need a second re pass.)
+# Label patterns are anchored to the start of a line (FNOL forms carry one
+# field per line) and never let the value run across a line break.
+# Quantifiers and optional label suffixes are possessive (*+, ++, {m,n}+,
+# (...)?+): the engine never backtracks into a label, separator or value run,
+# so adversarial input stays linear and a blank "Policy Number:" or
+# "Insured Name:" line cannot hand its label word back as the value.
+_FIELDS_RE = re.compile(
+    r'^[ \t]*+policy(?:[ \t]*+(?:number|no)\b)?+[.:# \t-]++(?P<policy>[A-Z0-9][A-Z0-9\-/]*+)'
+    r'|^[ \t]*+(?:(?:policyholder|insured)(?:[ \t]++name\b)?+|name(?:[ \t]++of[ \t]++(?:policyholder|insured)\b)?+)'
+    r"[: \t-]++(?P<name>[A-Za-z][A-Za-z .'-]{1,59}+)"
+    r'|^[ \t]*+(?:incident date|date of (?:loss|incident))[: \t-]*+(?P<incident_date>\S[^\n]*+)'
+    r'|^[ \t]*+(?:claimed amount|amount|total loss)[: \t-]*+(?P<amount>[₹$EUR£]?+[ \t]?+[\d,.]++)',
+    re.I | re.M,
+)
+_FIELD_GROUPS = len(_FIELDS_RE.groupindex)
+_SUBMISSION_RE = re.compile(r'(?:submission|reported|received)[:\s-]*+([\d/\-]{6,12}+)', re.I)
+_PHONE_RE = re.compile(r'\+?\d{10,13}+')
+
+
+class _AmountChars(dict):
+    """str.translate table keeping only decimal digits and '.'; filled lazily."""
+
+    def __missing__(self, code: int):
+        keep = code if code == 0x2E or chr(code).isdecimal() else None
+        self[code] = keep
+        return keep
+
+
+_AMOUNT_CHARS = _AmountChars()
+
+# One scan classifies the incident; group order doubles as priority order.
+_INCIDENT_RE = re.compile(
+    r'\b(?:(?P<theft>theft|stolen)|(?P<collision>collision|accident|crash)'
+    r'|(?P<fire>fire|burn)|(?P<water>flood|water\s++damage))\b',
+    re.I,
+)
+_INCIDENT_RANK = {kind: rank for rank, kind in enumerate(_INCIDENT_RE.groupindex)}
+
+# Supporting-document cues: plain substrings matched case-insensitively on
+# the original text ('police report' is covered by 'police')
+_POLICE_RE = re.compile(r'fir|police', re.I)
+_PHOTOS_RE = re.compile(r'photo|image|picture|attached', re.I)
 
 # ------------------------- Utilities -------------------------
 
+@lru_cache(maxsize=4096)
 def clean_text(text: str) -> str:
+    """Collapse whitespace within each line and drop blank lines."""
     t = text.replace('\r', '\n')
-    t = re.sub(r"\s+", ' ', t)
-    return t.strip()
+    # str.split() with no argument already collapses whitespace runs, no regex needed
+    lines = (' '.join(line.split()) for line in t.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_token(s: str):
+    """Parse a numeric date token with the one format its shape allows."""
+    for guard, fmt in _DATE_FORMATS:
+        if guard.fullmatch(s):
+            try:
+                return datetime.strptime(s, fmt).date()
+            except ValueError:
+                # right shape but not a calendar date, e.g. 30/02/2025
+                return None
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_month_date(s: str):
+    """Parse '9 December 2025' / '9 Dec 2025' without going through strptime."""
+    day, month, year = s.split()
+    mo = _MONTHS.get(month.lower())
+    if not mo:
+        return None
+    try:
+        return date(int(year), mo, int(day))
+    except ValueError:
+        return None
 
 
 def parse_date_first_match(text: str):
@@ -31,59 +143,86 @@ def parse_date_first_match(text: str):
     if not text:
         return None
     # search for common patterns
-    patterns = [r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}", r"\d{4}[/-]\d{1,2}[/-]\d{1,2}"]
-    for pat in patterns:
-        m = re.search(pat, text)
+    for pat in _DATE_PATTERNS:
+        m = pat.search(text)
         if m:
-            s = m.group(0)
-            for fmt in ("%d/%m/%Y", "%d-%m-%Y", "%d/%m/%y", "%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"):
-                try:
-                    return datetime.strptime(s, fmt).date()
-                except Exception:
-                    pass
+            d = _parse_date_token(m.group(0))
+            if d:
+                return d
     # fallback: try to find month names (e.g., 9 December 2025)
-    try:
-        # crude fuzzy parse: look for a 4-digit year and nearby tokens
-        m = re.search(r"(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})", text)
-        if m:
-            return datetime.strptime(m.group(1), "%d %B %Y").date()
-    except Exception:
-        pass
+    m = _MONTH_DATE_RE.search(text)
+    if m:
+        return _parse_month_date(m.group(1))
     return None
 
+
+def _json_default(obj: Any) -> Any:
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in dataclass_fields(obj)}
+    return str(obj)
+
+
+def to_json(obj: Any) -> str:
+    """Serialise results as indented JSON (dates become ISO strings)."""
+    if orjson is not None:
+        # orjson encodes dataclasses and dates natively
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    # ensure_ascii=False so both branches write the same bytes (e.g. a raw '₹')
+    return json.dumps(obj, default=_json_default, indent=2, ensure_ascii=False)
+
 # ------------------------- Extraction -------------------------
 
+def classify_incident(text: str) -> str:
+    """Return the highest-priority incident keyword found, or 'other'."""
+    best = None
+    for m in _INCIDENT_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == 'theft':
+            return kind
+        if best is None or _INCIDENT_RANK[kind] < _INCIDENT_RANK[best]:
+            best = kind
+    return best or 'other'
+
+
 def extract_fields(text: str) -> Dict[str, Any]:
+    # fresh dict per call: callers (process_claim_text) mutate the result
+    return dict(_extract_fields_cached(text))
+
+
+@lru_cache(maxsize=4096)
+def _extract_fields_cached(text: str) -> Tuple[Tuple[str, Any], ...]:
+    """Memoised extraction; returns the fields as an immutable tuple of items."""
     t = text
     out: Dict[str, Any] = {}
 
-    # Policy number (common patterns)
-    m = re.search(r'policy(?:\s*(?:no|number|#)[:\s-]*)?([A-Z0-9\-\/]*)', t, re.I)
-    out['policy_number'] = m.group(1).strip() if m and m.group(1) else None
+    # Single pass over the labelled lines; keep the first value seen for each field
+    found: Dict[str, str] = {}
+    for m in _FIELDS_RE.finditer(t):
+        found.setdefault(m.lastgroup, m.group(m.lastgroup))
+        if len(found) == _FIELD_GROUPS:
+            break
 
-    # Policyholder name: look for lines starting with Name, Policyholder, Insured
-    m = re.search(r'(?:name|policyholder|insured)[:\s-]{1,30}([A-Z][a-zA-Z .,-]{2,60})', t)
-    out['policyholder_name'] = m.group(1).strip() if m else None
+    out['policy_number'] = found.get('policy')
+    name = found.get('name')
+    out['policyholder_name'] = name.strip() if name else None
 
-    # Incident date (first date-like token)
-    out['incident_date'] = parse_date_first_match(t)
+    # Incident date: labelled date if present, else first date-like token
+    inc = parse_date_first_match(found.get('incident_date'))
+    out['incident_date'] = inc or parse_date_first_match(t)
 
     # Submission date if present
-    sub = None
-    m = re.search(r'(?:submission|reported|received)[:\s-]*([\d/\-]{6,12})', t, re.I)
-    if m:
-        sub = parse_date_first_match(m.group(1))
-    out['submission_date'] = sub
+    m = _SUBMISSION_RE.search(t)
+    out['submission_date'] = parse_date_first_match(m.group(1)) if m else None
 
     # Contact phone
-    m = re.search(r'(\+?\d{10,13})', t)
-    out['contact_phone'] = m.group(1) if m else None
+    m = _PHONE_RE.search(t)
+    out['contact_phone'] = m.group(0) if m else None
 
     # Claimed amount
-    m = re.search(r'(?:claimed amount|amount|total loss)[:\s-]*([₹$EUR£]?\s?[\d,\.]+)', t, re.I)
-    out['claimed_amount_text'] = m.group(1).strip() if m else None
+    amount = found.get('amount')
+    out['claimed_amount_text'] = amount.strip() if amount else None
     if out['claimed_amount_text']:
-        digits = re.sub(r'[^\d.]', '', out['claimed_amount_text'])
+        digits = out['claimed_amount_text'].translate(_AMOUNT_CHARS)
         try:
             out['claimed_amount_value'] = float(digits)
         except Exception:
@@ -92,105 +231,139 @@ def extract_fields(text: str) -> Dict[str, Any]:
         out['claimed_amount_value'] = None
 
     # Incident type via keywords
-    low = t.lower()
-    if re.search(r'\b(theft|stolen)\b', low):
-        out['incident_type'] = 'theft'
-    elif re.search(r'\b(collision|accident|crash)\b', low):
-        out['incident_type'] = 'collision'
-    elif re.search(r'\b(fire|burn)\b', low):
-        out['incident_type'] = 'fire'
-    elif re.search(r'\b(flood|water damage)\b', low):
-        out['incident_type'] = 'water'
-    else:
-        out['incident_type'] = 'other'
+    out['incident_type'] = classify_incident(t)
 
     # Supporting docs
-    out['has_police_report'] = bool(re.search(r'police report|fir|police', low))
-    out['has_photos'] = bool(re.search(r'photo|image|picture|attached', low))
+    out['has_police_report'] = _POLICE_RE.search(t) is not None
+    out['has_photos'] = _PHOTOS_RE.search(t) is not None
 
-    return out
+    return tuple(out.items())
 
 # ------------------------- Validation & Flags -------------------------
 
 def validate_fields(fields: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    flags, reasons = _validate_cached(
+        bool(fields.get('policy_number')),
+        bool(fields.get('policyholder_name')),
+        fields.get('incident_date'),
+        fields.get('submission_date'),
+        fields.get('claimed_amount_value'),
+        bool(fields.get('claimed_amount_text')),
+    )
+    return list(flags), list(reasons)
+
+
+@lru_cache(maxsize=8192)
+def _validate_cached(has_policy: bool, has_name: bool, incident_date: date, submission_date: date,
+                     val: float, has_amount_text: bool) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Rule chain behind validate_fields, memoised on the fields it reads."""
     flags: List[str] = []
     reasons: List[str] = []
-    if not fields.get('policy_number'):
+    if not has_policy:
         flags.append('missing_policy_number')
         reasons.append('Policy number not found.')
-    if not fields.get('policyholder_name'):
+    if not has_name:
         flags.append('missing_policyholder_name')
         reasons.append('Policyholder name not found.')
-    if not fields.get('incident_date'):
+    if not incident_date:
         flags.append('missing_incident_date')
         reasons.append('Incident date not found.')
     # date consistency
-    if fields.get('incident_date') and fields.get('submission_date'):
-        if fields['incident_date'] > fields['submission_date']:
+    if incident_date and submission_date:
+        if incident_date > submission_date:
             flags.append('incident_after_submission')
             reasons.append('Incident date is after submission date.')
     # claimed amount sanity
-    val = fields.get('claimed_amount_value')
-    if val is None and fields.get('claimed_amount_text'):
+    if val is None and has_amount_text:
         flags.append('unparseable_claim_amount')
         reasons.append('Claimed amount could not be parsed to a number.')
     if isinstance(val, (int, float)) and val > 1_000_000:
         flags.append('very_high_claim_amount')
         reasons.append('Very high claimed amount (> 1,000,000).')
-    return flags, reasons
+    return tuple(flags), tuple(reasons)
 
 # ------------------------- Severity & Routing -------------------------
 
+_INCIDENT_WEIGHT = {'fire': 0.5, 'collision': 0.2, 'theft': 0.3, 'water': 0.0, 'other': 0.0}
+
+
 def compute_severity(fields: Dict[str, Any]) -> float:
-    score = 0.0
-    it = fields.get('incident_type')
-    if it == 'fire':
-        score += 0.5
-    if it == 'collision':
-        score += 0.2
-    if it == 'theft':
-        score += 0.3
-    if fields.get('has_police_report'):
-        score -= 0.15
     amt = fields.get('claimed_amount_value') or 0
-    if amt > 200_000:
-        score += 0.35
-    if amt > 500_000:
-        score += 0.2
-    return max(0.0, min(1.0, score))
+    score = (_INCIDENT_WEIGHT.get(fields.get('incident_type'), 0.0)
+             - 0.15 * bool(fields.get('has_police_report'))
+             + 0.35 * (amt > 200_000)
+             + 0.2 * (amt > 500_000))
+    return 0.0 if score < 0.0 else 1.0 if score > 1.0 else score
 
 
 def decide_route(fields: Dict[str, Any], flags: List[str]) -> Tuple[str, str, float]:
     severity = compute_severity(fields)
+    low_risk = severity < 0.25 and (fields.get('claimed_amount_value') or 0) < 150_000
+    route, reason = _route_cached(tuple(flags), low_risk)
+    return route, reason, severity
+
+
+@lru_cache(maxsize=1024)
+def _route_cached(flags: Tuple[str, ...], low_risk: bool) -> Tuple[str, str]:
     if flags:
-        return 'manual_review', 'Missing or inconsistent information: ' + '; '.join(flags), severity
-    if severity < 0.25 and (fields.get('claimed_amount_value') or 0) < 150_000:
-        return 'fast_track', 'Low severity and complete fields', severity
-    return 'manual_review', 'Severity or amount requires review', severity
+        return 'manual_review', 'Missing or inconsistent information: ' + '; '.join(flags)
+    if low_risk:
+        return 'fast_track', 'Low severity and complete fields'
+    return 'manual_review', 'Severity or amount requires review'
 
 # ------------------------- Pipeline -------------------------
 
-def process_claim_text(text: str, submission_date: date = None) -> Dict[str, Any]:
+# Same for every claim, so shared rather than rebuilt per result
+_EXPLANATION = (
+    'Extraction: deterministic regex + keyword matching.',
+    'Validation: flags for missing/unparseable/inconsistent fields.',
+    'Routing: rule-based severity + presence of flags.',
+)
+
+
+@dataclass(slots=True)
+class ClaimResult:
+    """Outcome of processing one FNOL text (serialises via to_json)."""
+    extracted_fields: Dict[str, Any]
+    validation_flags: List[str]
+    validation_reasons: List[str]
+    severity_score: float
+    workflow: str
+    workflow_reason: str
+    explanation: Tuple[str, ...] = _EXPLANATION
+
+
+def process_claim_text(text: str, submission_date: date = None) -> ClaimResult:
     text = clean_text(text)
     fields = extract_fields(text)
     if submission_date:
         fields['submission_date'] = submission_date
     flags, reasons = validate_fields(fields)
     route, route_reason, severity = decide_route(fields, flags)
-    out = {
-        'extracted_fields': fields,
-        'validation_flags': flags,
-        'validation_reasons': reasons,
-        'severity_score': round(severity, 2),
-        'workflow': route,
-        'workflow_reason': route_reason,
-        'explanation': [
-            'Extraction: deterministic regex + keyword matching.',
-            'Validation: flags for missing/unparseable/inconsistent fields.',
-            'Routing: rule-based severity + presence of flags.'
-        ]
-    }
-    return out
+    return ClaimResult(fields, flags, reasons, round(severity, 2), route, route_reason)
+
+
+def process_claims_batch(texts: Iterable[str], submission_date: date = None,
+                         workers: int = 1, chunksize: int = 64,
+                         executor: Executor = None) -> List[ClaimResult]:
+    """Process many FNOL texts; results come back in input order.
+
+    With workers > 1 the texts are split into chunks of `chunksize` and
+    processed in a process pool; claims are independent, so chunks are too.
+    Pass a long-lived `executor` to reuse the same workers across batches:
+    their compiled patterns and lru caches then survive between calls
+    instead of being rebuilt by a fresh pool each time.
+    """
+    if executor is None and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return process_claims_batch(texts, submission_date, chunksize=chunksize, executor=ex)
+    if executor is not None:
+        texts = list(texts)
+        chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+        parts = executor.map(partial(process_claims_batch, submission_date=submission_date), chunks)
+        return [res for part in parts for res in part]
+
+    return [process_claim_text(t, submission_date) for t in texts]
 
 # ------------------------- Demo samples & run -------------------------
 
@@ -235,16 +408,16 @@ Contact: +919900112233
 
 def main():
     today = date(2025, 12, 9)  # demo submission date
+    batch = process_claims_batch((s['text'] for s in SAMPLES), submission_date=today)
     results = []
-    for s in SAMPLES:
+    for s, res in zip(SAMPLES, batch):
         print(f"--- Processing sample: {s['name']} ---")
-        res = process_claim_text(s['text'], submission_date=today)
-        print(json.dumps(res, default=str, indent=2))
+        print(to_json(res))
         results.append({'name': s['name'], 'result': res})
 
     # Optionally: write results to file
-    with open('demo_results.json', 'w') as f:
-        json.dump(results, f, default=str, indent=2)
+    with open('demo_results.json', 'w', encoding='utf-8') as f:
+        f.write(to_json(results))
     print('\nResults also saved to demo_results.json')
 
 if __name__ == '__main__':